@@ -13,6 +13,15 @@ from datetime import datetime
 from pathlib import Path
 import argparse
 
+# Compiled once and reused for every class in every scanned model file
+# Match variations: BaseModel, base.BaseModel, BaseModel with metaclass, etc.
+CLASS_PATTERN = re.compile(r'class\s+(\w+)\s*\(\s*(?:base\.)?BaseModel(?:\s*,.*?)?\s*\)\s*:')
+NEXT_CLASS_PATTERN = re.compile(r'\nclass\s+')
+# Field definitions - capture multiline field definitions
+FIELD_PATTERN = re.compile(r'(\w+)\s*=\s*(\w+Field)\s*\((.*?)\)(?:\s|$)', re.DOTALL)
+FK_TARGET_PATTERN = re.compile(r'^([^,\)]+)')
+CAMEL_CASE_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
+
 def parse_model_file(file_path):
     """Parse a Python model file and extract all class definitions"""
     try:
@@ -25,17 +34,15 @@ def parse_model_file(file_path):
     models = {}
     
     # Find all class definitions that inherit from BaseModel
-    # Match variations: BaseModel, base.BaseModel, BaseModel with metaclass, etc.
-    class_pattern = r'class\s+(\w+)\s*\(\s*(?:base\.)?BaseModel(?:\s*,.*?)?\s*\)\s*:'
-    matches = list(re.finditer(class_pattern, content))
+    matches = list(CLASS_PATTERN.finditer(content))
     
     for match in matches:
         class_name = match.group(1)
         class_start = match.end()
         
         # Find the end of the class (next class or end of file)
-        next_class = re.search(r'\nclass\s+', content[class_start:])
-        class_end = class_start + next_class.start() if next_class else len(content)
+        next_class = NEXT_CLASS_PATTERN.search(content, class_start)
+        class_end = next_class.start() if next_class else len(content)
         class_body = content[class_start:class_end]
         
         # Extract fields
@@ -43,9 +50,7 @@ def parse_model_file(file_path):
         foreign_keys = []
         primary_keys = []
         
-        # Pattern for field definitions - capture multiline field definitions
-        field_pattern = r'(\w+)\s*=\s*(\w+Field)\s*\((.*?)\)(?:\s|$)'
-        for field_match in re.finditer(field_pattern, class_body, re.DOTALL):
+        for field_match in FIELD_PATTERN.finditer(class_body):
             field_name = field_match.group(1)
             field_type = field_match.group(2)
             field_args = field_match.group(3)
@@ -71,7 +76,7 @@ def parse_model_file(file_path):
             # Check for foreign key
             if field_type == 'ForeignKeyField':
                 # Extract target model
-                target_match = re.search(r'^([^,\)]+)', field_args.strip())
+                target_match = FK_TARGET_PATTERN.search(field_args.strip())
                 if target_match:
                     target_model = target_match.group(1).strip()
                     
@@ -81,7 +86,7 @@ def parse_model_file(file_path):
                         target_model = target_parts[-1]
                     
                     # Convert CamelCase to snake_case for table name
-                    target_table = re.sub(r'(?<!^)(?=[A-Z])', '_', target_model).lower()
+                    target_table = CAMEL_CASE_BOUNDARY.sub('_', target_model).lower()
                     
                     fk_info = {
                         "column": field_name,
@@ -110,7 +115,7 @@ def parse_model_file(file_path):
             primary_keys.append("id")
         
         # Convert class name to table name (CamelCase to snake_case)
-        table_name = re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()
+        table_name = CAMEL_CASE_BOUNDARY.sub('_', class_name).lower()
         
         models[class_name] = {
             "table_name": table_name,
@@ -235,10 +240,11 @@ def scan_all_models(editor_path):
         
         print(f"📂 Scanning {db_dir}/...")
         
-        # Find all Python files in this directory
-        py_files = list(dir_path.glob('*.py'))
+        # Find all Python files in this directory (one scandir, no per-entry stat)
+        with os.scandir(dir_path) as entries:
+            py_names = [entry.name for entry in entries if entry.name.endswith('.py') and entry.is_file()]
         
-        for py_file in sorted(py_files):
+        for py_file in (dir_path / name for name in sorted(py_names)):
             # Skip __init__.py and base.py
             if py_file.name in ['__init__.py', 'base.py']:
                 continue
@@ -347,4 +353,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    exit(main())
+    raise SystemExit(main())
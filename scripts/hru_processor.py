@@ -11,15 +11,19 @@ from __future__ import annotations
 import argparse
 import contextlib
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import fnmatch
 import json
 import os
 from pathlib import Path
+import queue
 import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from typing import Any
 
 
@@ -79,6 +83,62 @@ OBJECT_TYPE_TO_COUNT_KEY = {
 
 COUNT_KEYS = tuple(key for key in COUNT_COLUMN_ALIASES if key != "obj")
 
+NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]")
+SWAT_OUTPUT_FLUSH_SECONDS = 0.05
+COPY_WORKERS = 8
+
+COPY_EXCLUDE_PATTERNS = (
+    "*.txt",
+    "*.csv",
+    "*.out",
+    "*.fin",
+    "*.sqlite",
+    "*.db",
+    "*.log",
+    "*.pid",
+    "fort.*",
+)
+
+# file.cio entries nulled for a standalone HRU subset (no routing network kept).
+SOLO_NULLIFIED_FILES = frozenset({
+    "rout_unit.dr",
+    "water_allocation.wro",
+    "element.wro",
+    "water_rights.wro",
+    "object.prt",
+    "rout_unit.con",
+    "aquifer.con",
+    "aquifer2d.con",
+    "channel.con",
+    "reservoir.con",
+    "recall.con",
+    "exco.con",
+    "delratio.con",
+    "outlet.con",
+    "chandeg.con",
+    "gwflow.con",
+    "hru-lte.con",
+})
+
+# file.cio entries nulled whenever routing is traced, alongside files of dropped object types.
+ROUTING_NULLIFIED_FILES = frozenset({
+    "water_allocation.wro",
+    "element.wro",
+    "water_rights.wro",
+    "object.prt",
+})
+
+# print.prt objects that report on routing units, which a standalone subset no longer has.
+ROUTING_UNIT_PRINT_OBJECTS = frozenset({
+    "lsunit_wb",
+    "lsunit_nb",
+    "lsunit_ls",
+    "lsunit_pw",
+    "ru",
+    "ru_salt",
+    "ru_cs",
+})
+
 
 def parse_filter_ids(filter_input: str) -> list[int]:
     ids: set[int] = set()
@@ -123,7 +183,7 @@ def resolve_txtinout_dir(dataset_path: str | os.PathLike[str]) -> Path:
 
 
 def normalize(value: str) -> str:
-    return re.sub(r"[^a-z0-9]", "", value.lower())
+    return NON_ALNUM_PATTERN.sub("", value.lower())
 
 
 def count_column_index(headers: list[str], key: str) -> int | None:
@@ -154,6 +214,29 @@ def format_count_fields(headers: list[str], fields: list[str]) -> str:
     return " ".join(fields[index].rjust(widths[index]) for index in range(len(fields))) + "\n"
 
 
+def expand_element_tokens(tokens: list[str]) -> list[int]:
+    values: list[int] = []
+    for token in tokens:
+        try:
+            values.append(int(token))
+        except ValueError:
+            continue
+
+    expanded: list[int] = []
+    index = 0
+    while index < len(values):
+        if index + 1 < len(values) and values[index + 1] < 0:
+            start = values[index]
+            end = abs(values[index + 1])
+            step = 1 if start <= end else -1
+            expanded.extend(range(start, end + step, step))
+            index += 2
+        else:
+            expanded.append(values[index])
+            index += 1
+    return expanded
+
+
 def update_object_count_file(path: str | os.PathLike[str], counts: dict[str, int]) -> None:
     path = Path(path)
     with path.open("r") as file:
@@ -168,6 +251,7 @@ def update_object_count_file(path: str | os.PathLike[str], counts: dict[str, int
     if obj_index is None:
         raise ValueError("object.cnt does not contain an object total column.")
 
+    column_indexes = {key: count_column_index(headers, key) for key in COUNT_KEYS}
     counts_by_key = canonical_counts(counts)
     total = sum(counts_by_key.get(key, 0) for key in COUNT_KEYS)
     new_lines = [title, header_line]
@@ -180,8 +264,7 @@ def update_object_count_file(path: str | os.PathLike[str], counts: dict[str, int
         if obj_index >= len(fields):
             raise ValueError("object.cnt data row has fewer columns than its header.")
 
-        for key in COUNT_KEYS:
-            index = count_column_index(headers, key)
+        for index in column_indexes.values():
             if index is not None and index < len(fields):
                 fields[index] = "0"
 
@@ -189,7 +272,7 @@ def update_object_count_file(path: str | os.PathLike[str], counts: dict[str, int
         for key, value in counts_by_key.items():
             if key == "obj":
                 continue
-            index = count_column_index(headers, key)
+            index = column_indexes[key]
             if index is None:
                 if value:
                     raise ValueError(f"object.cnt is missing a column for {key}.")
@@ -203,6 +286,22 @@ def update_object_count_file(path: str | os.PathLike[str], counts: dict[str, int
         file.writelines(new_lines)
 
 
+def nullify_file_references(content: str, filenames: set[str] | frozenset[str]) -> tuple[str, list[str]]:
+    # One alternation scanned once instead of a search + sub per filename; longer names are tried first.
+    names = {name.lower(): name for name in filenames}
+    if not names:
+        return content, []
+    alternatives = "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    pattern = re.compile(rf"\b(?:{alternatives})\b", re.IGNORECASE)
+    replaced: set[str] = set()
+
+    def replace(match: re.Match[str]) -> str:
+        replaced.add(names[match.group(0).lower()])
+        return "null"
+
+    return pattern.sub(replace, content), sorted(replaced)
+
+
 def make_unique_destination(path: Path) -> Path:
     if not path.exists():
         return path
@@ -222,7 +321,7 @@ def copy_swat(
     src_dir: str | os.PathLike[str],
     dest_dir: str | os.PathLike[str],
     overwrite: bool = False,
-    exclude_suffixes: list[str] | None = None,
+    exclude_suffixes: list[str] | tuple[str, ...] | None = None,
 ) -> Path:
     src = Path(src_dir).resolve()
     dest = Path(dest_dir).resolve()
@@ -236,46 +335,75 @@ def copy_swat(
             dest = make_unique_destination(dest)
 
     if exclude_suffixes is None:
-        exclude_suffixes = [
-            "*.txt",
-            "*.csv",
-            "*.out",
-            "*.fin",
-            "*.sqlite",
-            "*.db",
-            "*.log",
-            "*.pid",
-            "fort.*",
-        ]
+        exclude_suffixes = COPY_EXCLUDE_PATTERNS
 
     dest.mkdir(parents=True, exist_ok=True)
-    for entry in src.iterdir():
-        if not entry.is_file():
-            continue
-        lower_name = entry.name.lower()
-        if any(fnmatch.fnmatch(lower_name, pattern.lower()) for pattern in exclude_suffixes):
-            continue
-        shutil.copy2(entry, dest / entry.name)
+    # All exclude globs folded into one regex, so each entry is matched once instead of once per pattern.
+    patterns = sorted({pattern.lower() for pattern in exclude_suffixes})
+    excluded = re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns)).match if patterns else None
+    # scandir entries carry the file type from the directory read, so is_file() needs no extra stat
+    with os.scandir(src) as entries:
+        files = [
+            entry
+            for entry in entries
+            if entry.is_file() and not (excluded and excluded(entry.name.lower()))
+        ]
+
+    # A TxtInOut folder is hundreds of small files; copy2 releases the GIL, so copy several at once.
+    try:
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            try:
+                for _ in executor.map(lambda entry: shutil.copy2(entry.path, dest / entry.name), files):
+                    pass
+            except Exception:
+                # Stop queued copies so the folder can be removed once the running ones finish.
+                executor.shutdown(cancel_futures=True)
+                raise
+    except Exception:
+        # dest was created (or emptied) above, so a failed copy leaves nothing of the user's behind.
+        shutil.rmtree(dest, ignore_errors=True)
+        raise
 
     print(f"Working copy created: {dest}")
     return dest
 
 
+class DirectoryFiles:
+    """Regular files in one directory, read once; names match exactly first, then case-insensitively.
+
+    The modifiers only rewrite existing files, never add new ones, so the listing stays valid.
+    Case-insensitive matching mirrors os.path.isfile on Windows and macOS.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        self.dir = os.fspath(directory)
+        with os.scandir(self.dir) as entries:
+            names = [entry.name for entry in entries if entry.is_file()]
+        self._names = set(names)
+        self._names_by_lower: dict[str, str] = {}
+        for name in names:
+            self._names_by_lower.setdefault(name.lower(), name)
+
+    def __contains__(self, filename: str) -> bool:
+        return filename.lower() in self._names_by_lower
+
+    def path(self, filename: str) -> str:
+        if filename not in self._names:
+            filename = self._names_by_lower.get(filename.lower(), filename)
+        return os.path.join(self.dir, filename)
+
+
 class FileModifier:
-    def __init__(self, txtinout_dir: str | os.PathLike[str]):
+    def __init__(self, txtinout_dir: str | os.PathLike[str], files: DirectoryFiles | None = None):
         self.txtinout_dir = os.fspath(txtinout_dir)
         self.hru_id_map: dict[int, int] = {}
         self.hru_props_map: dict[int, int] = {}
+        self._files = files
 
     def _file_path(self, filename: str) -> str:
-        direct = os.path.join(self.txtinout_dir, filename)
-        if os.path.isfile(direct):
-            return direct
-        target = filename.lower()
-        for existing in os.listdir(self.txtinout_dir):
-            if existing.lower() == target:
-                return os.path.join(self.txtinout_dir, existing)
-        return direct
+        if self._files is None:
+            self._files = DirectoryFiles(self.txtinout_dir)
+        return self._files.path(filename)
 
     def _read_hru_rows(self) -> tuple[list[str], list[dict[str, str]]]:
         path = self._file_path("hru.con")
@@ -292,28 +420,6 @@ class FileModifier:
                 rows.append(dict(zip(headers, fields)))
         return headers, rows
 
-    def _expand_element_tokens(self, tokens: list[str]) -> list[int]:
-        values: list[int] = []
-        for token in tokens:
-            try:
-                values.append(int(token))
-            except ValueError:
-                continue
-
-        expanded: list[int] = []
-        index = 0
-        while index < len(values):
-            if index + 1 < len(values) and values[index + 1] < 0:
-                start = values[index]
-                end = abs(values[index + 1])
-                step = 1 if start <= end else -1
-                expanded.extend(range(start, end + step, step))
-                index += 2
-            else:
-                expanded.append(values[index])
-                index += 1
-        return expanded
-
     def _format_row(self, fields: list[str], width: int = 12) -> str:
         return " ".join(str(value).rjust(width) for value in fields) + "\n"
 
@@ -434,11 +540,10 @@ class FileModifier:
                 " ".join(column.rjust(width) for column, width in zip(base_col_names, column_widths))
                 + "\n"
             )
-            for row in renumbered:
-                file.write(
-                    " ".join(value.rjust(width) for value, width in zip(row, column_widths))
-                    + "\n"
-                )
+            file.writelines(
+                " ".join(value.rjust(width) for value, width in zip(row, column_widths)) + "\n"
+                for row in renumbered
+            )
 
         print(f"hru.con updated: kept {len(renumbered)} HRU(s).")
         return unique_props
@@ -447,40 +552,18 @@ class FileModifier:
         update_object_count_file(self._file_path("object.cnt"), {"hru": hru_count})
         print("object.cnt updated successfully.")
 
-    def modify_file_cio(self, parameters_to_nullify: set[str] | None = None) -> None:
-        if parameters_to_nullify is None:
-            parameters_to_nullify = {
-                "rout_unit.dr",
-                "water_allocation.wro",
-                "element.wro",
-                "water_rights.wro",
-                "object.prt",
-                "rout_unit.con",
-                "aquifer.con",
-                "aquifer2d.con",
-                "channel.con",
-                "reservoir.con",
-                "recall.con",
-                "exco.con",
-                "delratio.con",
-                "outlet.con",
-                "chandeg.con",
-                "gwflow.con",
-                "hru-lte.con",
-            }
+    def modify_file_cio(self, parameters_to_nullify: set[str] | frozenset[str] = SOLO_NULLIFIED_FILES) -> None:
         path = self._file_path("file.cio")
         with open(path, "r") as file:
             content = file.read()
-        for filename in parameters_to_nullify:
-            pattern = re.compile(rf"\b{re.escape(filename)}\b", re.IGNORECASE)
-            if pattern.search(content):
-                content = pattern.sub("null", content)
-                print(f"  {filename} -> null")
+        content, nullified = nullify_file_references(content, parameters_to_nullify)
+        for filename in nullified:
+            print(f"  {filename} -> null")
         with open(path, "w") as file:
             file.write(content)
         print("file.cio updated successfully.")
 
-    def disable_print_objects(self, object_names: set[str]) -> None:
+    def disable_print_objects(self, object_names: set[str] | frozenset[str]) -> None:
         path = self._file_path("print.prt")
         if not os.path.isfile(path):
             return
@@ -516,96 +599,19 @@ class FileModifier:
         }
 
     def modify_ls_unit_ele(self, hru_id_map: dict[int, int]) -> dict[int, int]:
-        path = self._file_path("ls_unit.ele")
-        if not os.path.isfile(path):
-            return {}
-        with open(path, "r") as file:
-            lines = file.readlines()
-        if len(lines) < 2:
-            return {}
-
-        title = lines[0]
-        column_header = lines[1]
-        headers = column_header.split()
-        id_idx = self._header_index(headers, {"id"}, 0)
-        typ_idx = self._header_index(headers, {"obj_typ", "objtyp"}, 2)
-        obj_idx = self._header_index(headers, {"obj_typ_no", "objtypno", "obj_id"}, 3)
-        if id_idx is None or typ_idx is None or obj_idx is None:
-            return {}
-
-        selected: list[tuple[int, int, list[str]]] = []
-        for line in lines[2:]:
-            fields = line.split()
-            if len(fields) <= max(id_idx, typ_idx, obj_idx):
-                continue
-            try:
-                old_elem_id = int(fields[id_idx])
-                old_hru_id = int(fields[obj_idx])
-            except ValueError:
-                continue
-            if fields[typ_idx].lower() == "hru" and old_hru_id in hru_id_map:
-                selected.append((hru_id_map[old_hru_id], old_elem_id, fields))
-
-        selected.sort(key=lambda item: item[0])
-        elem_map: dict[int, int] = {}
-        renumbered: list[list[str]] = []
-        for new_hru_id, old_elem_id, fields in selected:
-            elem_map[old_elem_id] = new_hru_id
-            fields[id_idx] = str(new_hru_id)
-            fields[obj_idx] = str(new_hru_id)
-            renumbered.append(fields)
-
-        with open(path, "w") as file:
-            file.write(title)
-            file.write(column_header)
-            for row in renumbered:
-                file.write(self._format_row(row))
-        print(f"ls_unit.ele updated: kept {len(renumbered)} element(s).")
-        return elem_map
+        return self._filter_unit_ele("ls_unit.ele", hru_id_map, sequential_ids=False)
 
     def modify_ls_unit_def(self, elem_map: dict[int, int]) -> dict[int, int]:
-        path = self._file_path("ls_unit.def")
-        if not os.path.isfile(path):
-            return {}
-        with open(path, "r") as file:
-            lines = file.readlines()
-        if len(lines) < 3:
-            return {}
+        return self._filter_unit_def("ls_unit.def", elem_map, elem_tot_idx=3, has_count_line=True)
 
-        title = lines[0]
-        column_header = lines[2]
-        def_map: dict[int, int] = {}
-        renumbered: list[list[str]] = []
-        for line in lines[3:]:
-            fields = line.split()
-            if len(fields) < 4:
-                continue
-            try:
-                old_def_id = int(fields[0])
-                elem_tot = int(fields[3])
-            except ValueError:
-                continue
-            old_elements = self._expand_element_tokens(fields[4 : 4 + elem_tot])
-            new_elements = [str(elem_map[elem]) for elem in old_elements if elem in elem_map]
-            if not new_elements:
-                continue
-            new_def_id = len(renumbered) + 1
-            def_map[old_def_id] = new_def_id
-            fields[0] = str(new_def_id)
-            fields[3] = str(len(new_elements))
-            renumbered.append(fields[:4] + new_elements)
+    def modify_rout_unit_ele(self, hru_id_map: dict[int, int]) -> dict[int, int]:
+        return self._filter_unit_ele("rout_unit.ele", hru_id_map, sequential_ids=True)
 
-        with open(path, "w") as file:
-            file.write(title)
-            file.write(f"{len(renumbered)}\n")
-            file.write(column_header)
-            for row in renumbered:
-                file.write(self._format_row(row))
-        print(f"ls_unit.def updated: kept {len(renumbered)} definition(s).")
-        return def_map
+    def modify_rout_unit_def(self, elem_map: dict[int, int]) -> dict[int, int]:
+        return self._filter_unit_def("rout_unit.def", elem_map, elem_tot_idx=2, has_count_line=False)
 
-    def modify_rout_unit_ele(self, hru_id_map: dict[int, int]) -> dict[int, int]:
-        path = self._file_path("rout_unit.ele")
+    def _filter_unit_ele(self, filename: str, hru_id_map: dict[int, int], sequential_ids: bool) -> dict[int, int]:
+        path = self._file_path(filename)
         if not os.path.isfile(path):
             return {}
         with open(path, "r") as file:
@@ -635,10 +641,12 @@ class FileModifier:
             if fields[typ_idx].lower() == "hru" and old_hru_id in hru_id_map:
                 selected.append((hru_id_map[old_hru_id], old_elem_id, fields))
 
+        # ls_unit.ele reuses the new HRU ID as the element ID; rout_unit.ele numbers elements sequentially.
         selected.sort(key=lambda item: item[0])
         elem_map: dict[int, int] = {}
         renumbered: list[list[str]] = []
-        for new_elem_id, (new_hru_id, old_elem_id, fields) in enumerate(selected, start=1):
+        for position, (new_hru_id, old_elem_id, fields) in enumerate(selected, start=1):
+            new_elem_id = position if sequential_ids else new_hru_id
             elem_map[old_elem_id] = new_elem_id
             fields[id_idx] = str(new_elem_id)
             fields[obj_idx] = str(new_hru_id)
@@ -647,50 +655,58 @@ class FileModifier:
         with open(path, "w") as file:
             file.write(title)
             file.write(column_header)
-            for row in renumbered:
-                file.write(self._format_row(row))
-        print(f"rout_unit.ele updated: kept {len(renumbered)} element(s).")
+            file.writelines(self._format_row(row) for row in renumbered)
+        print(f"{filename} updated: kept {len(renumbered)} element(s).")
         return elem_map
 
-    def modify_rout_unit_def(self, elem_map: dict[int, int]) -> dict[int, int]:
-        path = self._file_path("rout_unit.def")
+    def _filter_unit_def(
+        self,
+        filename: str,
+        elem_map: dict[int, int],
+        elem_tot_idx: int,
+        has_count_line: bool,
+    ) -> dict[int, int]:
+        path = self._file_path(filename)
         if not os.path.isfile(path):
             return {}
         with open(path, "r") as file:
             lines = file.readlines()
-        if len(lines) < 2:
+        header_idx = 2 if has_count_line else 1
+        if len(lines) <= header_idx:
             return {}
 
         title = lines[0]
-        column_header = lines[1]
-        ru_map: dict[int, int] = {}
+        column_header = lines[header_idx]
+        def_map: dict[int, int] = {}
         renumbered: list[list[str]] = []
-        for line in lines[2:]:
+        for line in lines[header_idx + 1 :]:
             fields = line.split()
-            if len(fields) < 3:
+            if len(fields) <= elem_tot_idx:
                 continue
             try:
-                old_ru_id = int(fields[0])
-                elem_tot = int(fields[2])
+                old_def_id = int(fields[0])
+                elem_tot = int(fields[elem_tot_idx])
             except ValueError:
                 continue
-            old_elements = self._expand_element_tokens(fields[3 : 3 + elem_tot])
+            first_elem_idx = elem_tot_idx + 1
+            old_elements = expand_element_tokens(fields[first_elem_idx : first_elem_idx + elem_tot])
             new_elements = [str(elem_map[elem]) for elem in old_elements if elem in elem_map]
             if not new_elements:
                 continue
-            new_ru_id = len(renumbered) + 1
-            ru_map[old_ru_id] = new_ru_id
-            fields[0] = str(new_ru_id)
-            fields[2] = str(len(new_elements))
-            renumbered.append(fields[:3] + new_elements)
+            new_def_id = len(renumbered) + 1
+            def_map[old_def_id] = new_def_id
+            fields[0] = str(new_def_id)
+            fields[elem_tot_idx] = str(len(new_elements))
+            renumbered.append(fields[:first_elem_idx] + new_elements)
 
         with open(path, "w") as file:
             file.write(title)
+            if has_count_line:
+                file.write(f"{len(renumbered)}\n")
             file.write(column_header)
-            for row in renumbered:
-                file.write(self._format_row(row))
-        print(f"rout_unit.def updated: kept {len(renumbered)} definition(s).")
-        return ru_map
+            file.writelines(self._format_row(row) for row in renumbered)
+        print(f"{filename} updated: kept {len(renumbered)} definition(s).")
+        return def_map
 
     def modify_rout_unit_rtu(self, ru_id_map: dict[int, int]) -> None:
         path = self._file_path("rout_unit.rtu")
@@ -720,8 +736,7 @@ class FileModifier:
         with open(path, "w") as file:
             file.write(title)
             file.write(column_header)
-            for row in renumbered:
-                file.write(self._format_row(row))
+            file.writelines(self._format_row(row) for row in renumbered)
         print(f"rout_unit.rtu updated: kept {len(renumbered)} row(s).")
 
     def modify_hru_data(self, filter_ids: list[int]) -> None:
@@ -736,10 +751,11 @@ class FileModifier:
         title = lines[0]
         column_header = lines[1]
         filter_set = {int(filter_id) for filter_id in filter_ids}
-        selected: list[str] = []
+        selected: list[list[str]] = []
         found_ids: set[int] = set()
         for line in lines[2:]:
-            fields = line.split()
+            # Only the ID is needed; the rest of the row is carried through unsplit.
+            fields = line.split(None, 1)
             if not fields:
                 continue
             try:
@@ -747,7 +763,7 @@ class FileModifier:
             except ValueError:
                 continue
             if data_id in filter_set:
-                selected.append(line)
+                selected.append(fields)
                 found_ids.add(data_id)
 
         missing_ids = sorted(filter_set - found_ids)
@@ -755,8 +771,7 @@ class FileModifier:
             raise ValueError(f"ID(s) not found in hru-data.hru: {missing_ids}")
 
         renumbered: list[str] = []
-        for new_id, line in enumerate(selected, start=1):
-            fields = line.split(maxsplit=1)
+        for new_id, fields in enumerate(selected, start=1):
             if len(fields) > 1:
                 renumbered.append(f"{new_id:>8} {fields[1]}\n")
             else:
@@ -773,6 +788,28 @@ class RoutingTracer:
     def __init__(self, txtinout_dir: str | os.PathLike[str]):
         self.dir = os.fspath(txtinout_dir)
         self._elem_id_map: dict[int, int] = {}
+        # One directory read up front; filtering rewrites existing files but never creates new ones.
+        self._files = DirectoryFiles(self.dir)
+
+        # Lines read while tracing are kept until the file is rewritten, so each file is read once.
+        self._read_cache: dict[str, list[str]] = {}
+        # Connection file rows split while tracing, reused when the file is filtered.
+        self._con_rows: dict[str, list[list[str]]] = {}
+
+    def _read_lines(self, path: str) -> list[str]:
+        lines = self._read_cache.get(path)
+        if lines is None:
+            with open(path, "r") as file:
+                lines = file.readlines()
+            self._read_cache[path] = lines
+        return lines
+
+    def _take_lines(self, path: str) -> list[str]:
+        lines = self._read_cache.pop(path, None)
+        if lines is None:
+            with open(path, "r") as file:
+                lines = file.readlines()
+        return lines
 
     def trace_and_filter(self, selected_hru_ids: list[int]) -> tuple[dict[str, set[int]], dict[str, dict[int, int]]]:
         ru_ids = self._find_routing_units_for_hrus(selected_hru_ids)
@@ -780,10 +817,9 @@ class RoutingTracer:
 
         graph: dict[tuple[str, int], list[tuple[str, int, str, float]]] = {}
         for typ, (con_file, _) in OBJ_TYPE_FILES.items():
-            path = os.path.join(self.dir, con_file)
-            if not os.path.isfile(path):
+            if con_file not in self._files:
                 continue
-            rows = self._parse_con_file(path)
+            rows = self._parse_con_file(self._files.path(con_file))
             for obj_id, fields in rows.items():
                 graph[(typ, obj_id)] = self._extract_routing_targets(fields)
 
@@ -791,21 +827,21 @@ class RoutingTracer:
         keep.setdefault("hru", set()).update(selected_hru_ids)
         keep.setdefault("ru", set()).update(ru_ids)
 
-        queue: deque[tuple[str, int]] = deque()
+        pending_nodes: deque[tuple[str, int]] = deque()
         for hid in selected_hru_ids:
-            queue.append(("hru", hid))
+            pending_nodes.append(("hru", hid))
         for rid in ru_ids:
-            queue.append(("ru", rid))
+            pending_nodes.append(("ru", rid))
 
-        visited = set(queue)
-        while queue:
-            node = queue.popleft()
+        visited = set(pending_nodes)
+        while pending_nodes:
+            node = pending_nodes.popleft()
             for target_typ, target_id, _, _ in graph.get(node, []):
                 key = (target_typ, target_id)
                 if key not in visited:
                     visited.add(key)
                     keep.setdefault(target_typ, set()).add(target_id)
-                    queue.append(key)
+                    pending_nodes.append(key)
 
         print("Objects to keep:")
         for typ in sorted(keep):
@@ -819,13 +855,13 @@ class RoutingTracer:
         for typ, (con_file, data_file) in OBJ_TYPE_FILES.items():
             if typ not in keep:
                 continue
-            con_path = os.path.join(self.dir, con_file)
+            con_path = self._files.path(con_file)
             original_props: set[int] = set()
-            if os.path.isfile(con_path):
+            if con_file in self._files:
                 original_props = self._filter_con_file(con_path, keep[typ], id_maps[typ], id_maps)
             if data_file:
-                data_path = os.path.join(self.dir, data_file)
-                if os.path.isfile(data_path):
+                data_path = self._files.path(data_file)
+                if data_file in self._files:
                     filter_ids_for_data = original_props if original_props else keep[typ]
                     data_map = {old: new for new, old in enumerate(sorted(filter_ids_for_data), start=1)}
                     self._filter_data_file(data_path, filter_ids_for_data, data_map)
@@ -835,26 +871,28 @@ class RoutingTracer:
             self._filter_rout_unit_def(keep["ru"], id_maps)
 
         if "hru" in id_maps:
-            modifier = FileModifier(self.dir)
+            modifier = FileModifier(self.dir, self._files)
             lsu_elem_map = modifier.modify_ls_unit_ele(id_maps["hru"])
             modifier.modify_ls_unit_def(lsu_elem_map)
 
         update_object_count_file(
-            os.path.join(self.dir, "object.cnt"),
+            self._files.path("object.cnt"),
             {typ: len(ids) for typ, ids in keep.items()},
         )
         print("  object.cnt updated")
         self._update_file_cio(keep)
+        self._read_cache.clear()
+        self._con_rows.clear()
         return keep, id_maps
 
     def _parse_con_file(self, path: str) -> dict[int, list[str]]:
         rows: dict[int, list[str]] = {}
-        with open(path, "r") as file:
-            lines = file.readlines()
+        lines = self._read_lines(path)
         if len(lines) < 3:
             return rows
-        for line in lines[2:]:
-            fields = line.split()
+        split_rows = [line.split() for line in lines[2:]]
+        self._con_rows[path] = split_rows
+        for fields in split_rows:
             if not fields:
                 continue
             try:
@@ -863,28 +901,6 @@ class RoutingTracer:
                 continue
         return rows
 
-    def _expand_element_tokens(self, tokens: list[str]) -> list[int]:
-        values: list[int] = []
-        for token in tokens:
-            try:
-                values.append(int(token))
-            except ValueError:
-                continue
-
-        expanded: list[int] = []
-        index = 0
-        while index < len(values):
-            if index + 1 < len(values) and values[index + 1] < 0:
-                start = values[index]
-                end = abs(values[index + 1])
-                step = 1 if start <= end else -1
-                expanded.extend(range(start, end + step, step))
-                index += 2
-            else:
-                expanded.append(values[index])
-                index += 1
-        return expanded
-
     def _extract_routing_targets(self, fields: list[str]) -> list[tuple[str, int, str, float]]:
         targets: list[tuple[str, int, str, float]] = []
         try:
@@ -910,11 +926,10 @@ class RoutingTracer:
 
     def _find_routing_units_for_hrus(self, hru_ids: list[int]) -> set[int]:
         hru_set = set(hru_ids)
-        ele_path = os.path.join(self.dir, "rout_unit.ele")
+        ele_path = self._files.path("rout_unit.ele")
         hru_elem_ids: set[int] = set()
-        if os.path.isfile(ele_path):
-            with open(ele_path, "r") as file:
-                lines = file.readlines()
+        if "rout_unit.ele" in self._files:
+            lines = self._read_lines(ele_path)
             for line in lines[2:]:
                 fields = line.split()
                 if len(fields) < 4:
@@ -928,11 +943,10 @@ class RoutingTracer:
                 if obj_typ == "hru" and obj_typ_no in hru_set:
                     hru_elem_ids.add(elem_id)
 
-        def_path = os.path.join(self.dir, "rout_unit.def")
+        def_path = self._files.path("rout_unit.def")
         ru_ids: set[int] = set()
-        if os.path.isfile(def_path):
-            with open(def_path, "r") as file:
-                lines = file.readlines()
+        if "rout_unit.def" in self._files:
+            lines = self._read_lines(def_path)
             for line in lines[2:]:
                 fields = line.split()
                 if len(fields) < 3:
@@ -942,7 +956,7 @@ class RoutingTracer:
                     num_elem = int(fields[2])
                 except (ValueError, IndexError):
                     continue
-                elem_ids = set(self._expand_element_tokens(fields[3 : 3 + num_elem]))
+                elem_ids = set(expand_element_tokens(fields[3 : 3 + num_elem]))
                 if elem_ids & hru_elem_ids:
                     ru_ids.add(ru_id)
         return ru_ids
@@ -954,8 +968,7 @@ class RoutingTracer:
         my_map: dict[int, int],
         all_maps: dict[str, dict[int, int]],
     ) -> set[int]:
-        with open(path, "r") as file:
-            lines = file.readlines()
+        lines = self._take_lines(path)
         if len(lines) < 2:
             return set()
 
@@ -966,10 +979,13 @@ class RoutingTracer:
         props_idx = 7 if len(col_names) > 7 else None
         src_idx = next((i for i, col in enumerate(col_names) if col.lower() == "src_tot"), 12)
 
+        split_rows = self._con_rows.pop(path, None)
+        if split_rows is None:
+            split_rows = [line.split() for line in lines[2:]]
+
         kept_strs = {str(item) for item in kept_ids}
         selected: list[list[str]] = []
-        for line in lines[2:]:
-            fields = line.split()
+        for fields in split_rows:
             if fields and fields[id_idx] in kept_strs:
                 selected.append(fields)
 
@@ -1028,8 +1044,7 @@ class RoutingTracer:
         with open(path, "w") as file:
             file.write(header)
             file.write(col_header)
-            for row in renumbered:
-                file.write("  ".join(value.rjust(8) for value in row) + "\n")
+            file.writelines("  ".join(value.rjust(8) for value in row) + "\n" for row in renumbered)
         print(f"  {os.path.basename(path)}: kept {len(renumbered)} rows")
         return original_props
 
@@ -1044,30 +1059,27 @@ class RoutingTracer:
         kept_strs = {str(item) for item in kept_ids}
         renumbered: list[str] = []
         for line in lines[2:]:
-            fields = line.split()
+            fields = line.split(None, 1)
             if not fields or fields[0] not in kept_strs:
                 continue
             old_id = int(fields[0])
             new_id = id_map[old_id]
-            rest = line.split(maxsplit=1)
-            if len(rest) > 1:
-                renumbered.append(f"{new_id:>8} {rest[1]}")
+            if len(fields) > 1:
+                renumbered.append(f"{new_id:>8} {fields[1]}")
             else:
                 renumbered.append(f"{new_id:>8}\n")
 
         with open(path, "w") as file:
             file.write(header)
             file.write(col_header)
-            for line in renumbered:
-                file.write(line if line.endswith("\n") else line + "\n")
+            file.writelines(line if line.endswith("\n") else line + "\n" for line in renumbered)
         print(f"  {os.path.basename(path)}: kept {len(renumbered)} rows")
 
     def _filter_rout_unit_ele(self, keep: dict[str, set[int]], id_maps: dict[str, dict[int, int]]) -> None:
-        path = os.path.join(self.dir, "rout_unit.ele")
-        if not os.path.isfile(path):
+        path = self._files.path("rout_unit.ele")
+        if "rout_unit.ele" not in self._files:
             return
-        with open(path, "r") as file:
-            lines = file.readlines()
+        lines = self._take_lines(path)
         if len(lines) < 3:
             return
 
@@ -1102,16 +1114,14 @@ class RoutingTracer:
         with open(path, "w") as file:
             file.write(header)
             file.write(col_header)
-            for row in renumbered:
-                file.write("  ".join(value.rjust(12) for value in row) + "\n")
+            file.writelines("  ".join(value.rjust(12) for value in row) + "\n" for row in renumbered)
         print(f"  rout_unit.ele: kept {len(renumbered)} elements")
 
     def _filter_rout_unit_def(self, kept_ru_ids: set[int], id_maps: dict[str, dict[int, int]]) -> None:
-        path = os.path.join(self.dir, "rout_unit.def")
-        if not os.path.isfile(path):
+        path = self._files.path("rout_unit.def")
+        if "rout_unit.def" not in self._files:
             return
-        with open(path, "r") as file:
-            lines = file.readlines()
+        lines = self._take_lines(path)
         if len(lines) < 3:
             return
 
@@ -1130,7 +1140,7 @@ class RoutingTracer:
                 num_elem = int(fields[2])
             except ValueError:
                 num_elem = 0
-            old_elements = self._expand_element_tokens(fields[3 : 3 + num_elem])
+            old_elements = expand_element_tokens(fields[3 : 3 + num_elem])
             new_elem_refs = [
                 str(self._elem_id_map[old_elem])
                 for old_elem in old_elements
@@ -1142,31 +1152,23 @@ class RoutingTracer:
         with open(path, "w") as file:
             file.write(header)
             file.write(col_header)
-            for row in renumbered:
-                file.write("  ".join(value.rjust(12) for value in row) + "\n")
+            file.writelines("  ".join(value.rjust(12) for value in row) + "\n" for row in renumbered)
         print(f"  rout_unit.def: kept {len(renumbered)} routing units")
 
     def _update_file_cio(self, keep: dict[str, set[int]]) -> None:
-        always_null = {
-            "water_allocation.wro",
-            "element.wro",
-            "water_rights.wro",
-            "object.prt",
-        }
+        always_null = set(ROUTING_NULLIFIED_FILES)
         for typ, (con_file, data_file) in OBJ_TYPE_FILES.items():
             if typ not in keep:
                 always_null.add(con_file)
                 if data_file:
                     always_null.add(data_file)
 
-        path = os.path.join(self.dir, "file.cio")
+        path = self._files.path("file.cio")
         with open(path, "r") as file:
             content = file.read()
-        for param in always_null:
-            pattern = re.compile(rf"\b{re.escape(param)}\b", re.IGNORECASE)
-            if pattern.search(content):
-                content = pattern.sub("null", content)
-                print(f"    {param} -> null")
+        content, nullified = nullify_file_references(content, always_null)
+        for param in nullified:
+            print(f"    {param} -> null")
         with open(path, "w") as file:
             file.write(content)
         print("  file.cio updated")
@@ -1197,13 +1199,40 @@ def run_swat(directory: Path, exe_path: Path) -> None:
         stderr=subprocess.STDOUT,
     ) as process:
         assert process.stdout is not None
+        # SWAT+ prints a progress line per simulated day; echo them in batches so the
+        # extension's output channel receives at most one write per SWAT_OUTPUT_FLUSH_SECONDS
+        # (about 20 a second) instead of one per line.
+        # Lines are read on a thread so a quiet spell still flushes what has arrived.
+        lines: queue.Queue[bytes | None] = queue.Queue()
+
+        def read_output() -> None:
+            for raw_output in iter(process.stdout.readline, b""):
+                lines.put(raw_output)
+            lines.put(None)
+
+        reader = threading.Thread(target=read_output, daemon=True)
+        reader.start()
+        pending: list[str] = []
+        last_flush = time.monotonic()
         while True:
-            raw_output = process.stdout.readline()
-            if raw_output == b"" and process.poll() is not None:
+            try:
+                raw_output = lines.get(timeout=SWAT_OUTPUT_FLUSH_SECONDS)
+            except queue.Empty:
+                raw_output = b""
+            if raw_output is None:
                 break
             output = raw_output.decode("latin-1", errors="replace").strip()
             if output:
-                print(output)
+                pending.append(output)
+            now = time.monotonic()
+            if pending and (not raw_output or now - last_flush >= SWAT_OUTPUT_FLUSH_SECONDS):
+                print("\n".join(pending), flush=True)
+                pending.clear()
+                last_flush = now
+        reader.join()
+        if pending:
+            print("\n".join(pending), flush=True)
+        process.wait()
         if process.returncode != 0:
             raise RuntimeError(f"SWAT+ exited with code {process.returncode}.")
     print("SWAT+ simulation completed successfully.")
@@ -1227,27 +1256,24 @@ def process_hru_subset(
     requested_dest = Path(output_dir).resolve() if output_dir else source_dir / dest_folder_name
     dest_dir = copy_swat(source_dir, requested_dest, overwrite=overwrite)
 
-    if keep_routing:
-        keep, id_maps = RoutingTracer(dest_dir).trace_and_filter(hru_ids)
-        retained_counts = {key: len(value) for key, value in keep.items()}
-    else:
-        modifier = FileModifier(dest_dir)
-        props_ids = modifier.modify_hru_con(hru_ids)
-        modifier.modify_hru_data(props_ids if props_ids else hru_ids)
-        modifier.modify_secondary_references()
-        modifier.modify_object_cnt(len(hru_ids))
-        modifier.modify_file_cio()
-        modifier.disable_print_objects({
-            "lsunit_wb",
-            "lsunit_nb",
-            "lsunit_ls",
-            "lsunit_pw",
-            "ru",
-            "ru_salt",
-            "ru_cs",
-        })
-        id_maps = {"hru": modifier.hru_id_map}
-        retained_counts = {"hru": len(hru_ids)}
+    try:
+        if keep_routing:
+            keep, id_maps = RoutingTracer(dest_dir).trace_and_filter(hru_ids)
+            retained_counts = {key: len(value) for key, value in keep.items()}
+        else:
+            modifier = FileModifier(dest_dir)
+            props_ids = modifier.modify_hru_con(hru_ids)
+            modifier.modify_hru_data(props_ids if props_ids else hru_ids)
+            modifier.modify_secondary_references()
+            modifier.modify_object_cnt(len(hru_ids))
+            modifier.modify_file_cio()
+            modifier.disable_print_objects(ROUTING_UNIT_PRINT_OBJECTS)
+            id_maps = {"hru": modifier.hru_id_map}
+            retained_counts = {"hru": len(hru_ids)}
+    except Exception:
+        # Remove the half-filtered copy so a failed run leaves nothing behind to clean up before retrying.
+        shutil.rmtree(dest_dir, ignore_errors=True)
+        raise
 
     simulation_exe: str | None = None
     if run_simulation:
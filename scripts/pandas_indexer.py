@@ -16,19 +16,55 @@ Enhanced to handle:
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import json
-import re
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 
 
 # Constants
-NUMERIC_VALUE_PATTERN = re.compile(r'^\d+(\.\d+)?$')
 MAX_CHILD_LINES = 1000  # Sanity check limit to prevent excessive line skipping
+FILE_READ_WORKERS = 8  # Threads reading TxtInOut files ahead of the parser
+WORKER_NICE_INCREMENT = 5  # Lower parse worker priority so VS Code stays responsive
 MANAGEMENT_SCH_OP_DATA1_INDEX = 6  # Position of op_data1 field in management schedule operation lines
 DTL_ACTION_FP_INDEX = 7  # Position of fp field in decision table action lines
+SOIL_LAYER_COLUMNS = (
+    "dp", "bd", "awc", "soil_k", "carbon", "clay", "silt", "sand",
+    "rock", "alb", "usle_k", "ec", "caco3", "ph"
+)
+PLANT_INI_CHILD_COLUMNS = (
+    "plnt_name", "lc_status", "lai_init", "bm_init",
+    "phu_init", "plnt_pop", "yrs_init", "rsd_init"
+)
+# Leading decision table columns; alt<n> / out<n> columns follow, one per alternative
+DTL_CONDITION_COLUMNS = ("cond_var", "obj", "obj_num", "lim_var", "lim_op", "lim_const")
+DTL_ACTION_COLUMNS = ("act_typ", "obj", "obj_num", "act_name", "act_option", "const", "const2", "fp")
+# Target tables for FK-bearing fields, keyed by operation / action type
+MANAGEMENT_SCH_OP_TABLES = {
+    'plnt': 'plant_ini',
+    'harv': 'harv_ops',
+    'hvkl': 'plant_ini',
+    'kill': 'plant_ini',
+    'till': 'tillage_til',
+    'irrm': 'irr_ops',
+    'irra': 'irr_ops',
+    'fert': 'fertilizer_frt',
+    'frta': 'fertilizer_frt',
+    'frtc': 'fertilizer_frt',
+    'pest': 'pesticide_pes',
+    'pstc': 'pesticide_pes',
+    'graz': 'graze_ops'
+}
+DTL_ACTION_FP_TABLES = {
+    'harvest': 'harv_ops',
+    'harvest_kill': 'harv_ops',
+    'pest_apply': 'chem_app_ops',
+    'fertilize': 'chem_app_ops'
+}
 WEATHER_DATA_SCHEMA_FILES = {
     ".pcp": "weather-pcp.pcp",
     ".tem": "weather-tmp.tmp",
@@ -37,7 +73,6 @@ WEATHER_DATA_SCHEMA_FILES = {
     ".hmd": "weather-hmd.hmd",
     ".wnd": "weather-wnd.wnd",
 }
-COUNT_LINE_PATTERN = re.compile(r"^\d+$")
 HEADER_ALIASES_BY_FILE = {
     "calibration.cal": {
         "name": "cal_parm",
@@ -71,6 +106,11 @@ def load_json(path: Path) -> dict:
         return json.load(handle)
 
 
+def read_lines(file_path: Path) -> List[str]:
+    with file_path.open("r", encoding="utf-8", errors="ignore") as handle:
+        return handle.readlines()
+
+
 def normalize_header_token(file_name: str, token: str) -> str:
     lowered = token.lower()
     return HEADER_ALIASES_BY_FILE.get(file_name.lower(), {}).get(lowered, lowered)
@@ -86,7 +126,7 @@ def count_schema_header_matches(header_columns: List[str], schema_columns: List[
 
 
 def is_standalone_count_line(raw_line: str) -> bool:
-    return bool(COUNT_LINE_PATTERN.fullmatch(raw_line.strip()))
+    return raw_line.strip().isdecimal()
 
 
 def load_file_cio_filenames(dataset_path: Path) -> Set[str]:
@@ -94,8 +134,7 @@ def load_file_cio_filenames(dataset_path: Path) -> Set[str]:
     if not file_cio_path.exists():
         return set()
     try:
-        with file_cio_path.open("r", encoding="utf-8", errors="ignore") as handle:
-            lines = handle.readlines()
+        lines = read_lines(file_cio_path)
     except OSError:
         return set()
 
@@ -118,10 +157,47 @@ def load_file_cio_filenames(dataset_path: Path) -> Set[str]:
     return filenames
 
 
+def list_dataset_files(dataset_path: Path) -> List[str]:
+    """List the regular files in the dataset directory with a single scandir call."""
+    try:
+        with os.scandir(dataset_path) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+    except OSError:
+        return []
+
+
+def build_dataset_file_lookup(names: List[str]) -> Dict[str, str]:
+    """Key on-disk file names by exact and lowercase name."""
+    dataset_files = {name: name for name in names}
+    for name in names:
+        dataset_files.setdefault(name.lower(), name)
+    return dataset_files
+
+
+def group_dataset_files_by_suffix(names: List[str]) -> Dict[str, List[str]]:
+    """Group file names by lowercased extension, so STA1.PCP and sta1.pcp land under the same key.
+
+    Like dataset_path.glob("*<ext>"), dotfiles are included; matching is case-insensitive on
+    every platform, as glob already was on Windows.
+    """
+    files_by_suffix: Dict[str, List[str]] = {}
+    for name in names:
+        # Split at the last dot directly: splitext would give ".pcp" itself no extension.
+        _, dot, extension = name.rpartition(".")
+        files_by_suffix.setdefault(f".{extension.lower()}" if dot else "", []).append(name)
+    return files_by_suffix
+
+
+def find_dataset_file(dataset_files: Dict[str, str], file_name: str) -> Optional[str]:
+    """Return the on-disk name for file_name, preferring an exact match over a case-insensitive one."""
+    return dataset_files.get(file_name) or dataset_files.get(file_name.lower())
+
+
 def find_file_cio_override(
     dataset_path: Path,
     schema_file: str,
-    file_cio_files: Set[str]
+    file_cio_files: Set[str],
+    dataset_files: Dict[str, str]
 ) -> Optional[Path]:
     if not file_cio_files:
         return None
@@ -135,8 +211,8 @@ def find_file_cio_override(
     ]
     if len(candidates) != 1:
         return None
-    candidate_path = dataset_path / candidates[0]
-    return candidate_path if candidate_path.exists() else None
+    actual_name = find_dataset_file(dataset_files, candidates[0])
+    return dataset_path / actual_name if actual_name else None
 
 
 def is_hierarchical_file(file_name: str, metadata: dict) -> bool:
@@ -217,35 +293,35 @@ def get_child_line_count(value_map: Dict[str, str], config: dict, file_name: str
     return 0
 
 
-def is_main_record_line(value_map: Dict[str, str], file_name: str, tokens: List[str]) -> bool:
-    """Check if a line is a main record (vs child line) in a hierarchical file."""
-    # For soils.sol: Main record lines have an integer layer count and an alpha hydrologic group.
+def is_soil_main_record(tokens: List[str]) -> bool:
+    # Main record lines have an integer layer count and an alpha hydrologic group.
     # Soil names can be numeric, so avoid rejecting purely numeric identifiers.
-    if file_name == 'soils.sol':
-        if len(tokens) < 3:
-            return False
-        try:
-            int(tokens[1])
-        except ValueError:
-            return False
-        return tokens[2].isalpha()
-    
-    # For plant.ini: Main record has numeric plant count as the second token
-    if file_name == 'plant.ini':
-        if len(tokens) < 2:
-            return False
-        try:
-            int(tokens[1])
-            return True
-        except ValueError:
-            return False
-    
-    # For decision tables: More complex, for now treat all as main records
-    if file_name.endswith('.dtl'):
+    if len(tokens) < 3:
+        return False
+    try:
+        int(tokens[1])
+    except ValueError:
+        return False
+    return tokens[2].isalpha()
+
+
+def is_plant_main_record(tokens: List[str]) -> bool:
+    # Main record has numeric plant count as the second token
+    if len(tokens) < 2:
+        return False
+    try:
+        int(tokens[1])
         return True
-    
-    # Default: treat as main record
-    return True
+    except ValueError:
+        return False
+
+
+# Heuristic main-record detectors by file name; other files (including
+# decision tables) treat every line as a main record.
+MAIN_RECORD_DETECTORS = {
+    "soils.sol": is_soil_main_record,
+    "plant.ini": is_plant_main_record,
+}
 
 
 def parse_lines_to_dataframe(
@@ -265,7 +341,8 @@ def parse_lines_to_dataframe(
             Raw record list for payload construction
         )
     """
-    file_name = file_path.name
+    # Schema and metadata keys are lowercase; the file on disk may be spelled Soils.sol etc.
+    file_name = file_path.name.lower()
     start_line = table.get("data_starts_after", 0)
     file_metadata = metadata.get("file_metadata", {}).get(file_name, {})
     include_auto_fields = "id" in (file_metadata.get("primary_keys") or [])
@@ -284,8 +361,7 @@ def parse_lines_to_dataframe(
     hierarchical_config = get_hierarchical_config(file_name, metadata) if is_hierarchical else None
     
     if lines is None:
-        with file_path.open("r", encoding="utf-8", errors="ignore") as handle:
-            lines = handle.readlines()
+        lines = read_lines(file_path)
 
     columns = schema_columns
     if table.get("has_header_line") and lines:
@@ -310,6 +386,9 @@ def parse_lines_to_dataframe(
         if header_columns and any(col in schema_columns_all for col in header_columns):
             columns = header_columns
     
+    column_count = len(columns)
+    main_record_detector = MAIN_RECORD_DETECTORS.get(file_name)
+    is_plant_ini = file_name == "plant.ini"
     i = start_line
     while i < len(lines):
         line = lines[i].strip()
@@ -318,9 +397,8 @@ def parse_lines_to_dataframe(
             continue
         
         values = line.split()
-        value_map: Dict[str, str] = {}
-        for col_idx, col_name in enumerate(columns):
-            value_map[col_name] = values[col_idx] if col_idx < len(values) else ""
+        padded_values = values if len(values) >= column_count else values + [""] * (column_count - len(values))
+        value_map: Dict[str, str] = dict(zip(columns, padded_values))
         
         # For hierarchical files, determine if this is a main record or child line
         skip_count = 0
@@ -335,8 +413,8 @@ def parse_lines_to_dataframe(
                 child_line_info.append((i + 1, skip_count))
             else:
                 # No explicit count - use heuristic detection
-                is_main_record = is_main_record_line(value_map, file_name, values)
-                if file_name == "plant.ini" and is_main_record and len(values) > 1:
+                is_main_record = main_record_detector(values) if main_record_detector else True
+                if is_plant_ini and is_main_record and len(values) > 1:
                     try:
                         skip_count = int(values[1])
                         if skip_count > 0:
@@ -377,17 +455,29 @@ def parse_lines_to_dataframe(
 
     df["pkValueLower"] = df["pkValue"].str.lower()
 
-    for idx, record in enumerate(records):
-        record["pkValue"] = str(df.at[idx, "pkValue"])
-        record["pkValueLower"] = str(df.at[idx, "pkValueLower"])
+    for record, pk_value, pk_value_lower in zip(records, df["pkValue"].tolist(), df["pkValueLower"].tolist()):
+        record["pkValue"] = str(pk_value)
+        record["pkValueLower"] = str(pk_value_lower)
 
     return df, child_line_info, columns, records
 
 
-def build_weather_data_rows(file_path: Path, table: dict) -> Tuple[List[dict], Dict[str, str]]:
+def get_weather_schema_columns(table: dict) -> List[str]:
+    """Schema columns stored for a weather data file (AutoField columns are database-only)."""
+    return [
+        col["name"]
+        for col in table.get("columns", [])
+        if col.get("type") != "AutoField"
+    ]
+
+
+def build_weather_data_rows(
+    file_path: Path,
+    table: dict,
+    schema_columns: Optional[List[str]] = None
+) -> Tuple[List[dict], Dict[str, str]]:
     """Build row payloads for weather data files with comment + header + station metadata + all data rows."""
-    with file_path.open("r", encoding="utf-8", errors="ignore") as handle:
-        lines = handle.readlines()
+    lines = read_lines(file_path)
 
     if not lines:
         return [], {}
@@ -406,12 +496,9 @@ def build_weather_data_rows(file_path: Path, table: dict) -> Tuple[List[dict], D
     if station_idx is None:
         return [], {}
 
-    station_values = lines[station_idx].strip().split()
-    schema_columns = [
-        col["name"]
-        for col in table.get("columns", [])
-        if col.get("type") != "AutoField"
-    ]
+    station_values = lines[station_idx].split()
+    if schema_columns is None:
+        schema_columns = get_weather_schema_columns(table)
 
     values: Dict[str, str] = {col: "" for col in schema_columns}
     name_value = comment_line or file_path.name
@@ -432,6 +519,7 @@ def build_weather_data_rows(file_path: Path, table: dict) -> Tuple[List[dict], D
     # If no specific data columns, use all remaining columns or allow flexible parsing
     if not data_columns:
         data_columns = schema_columns[:]
+    data_column_count = len(data_columns)
     
     for data_line_idx in range(station_idx + 1, len(lines)):
         line = lines[data_line_idx].strip()
@@ -439,17 +527,13 @@ def build_weather_data_rows(file_path: Path, table: dict) -> Tuple[List[dict], D
             continue
         
         data_values = line.split()
-        data_value_map: Dict[str, str] = {}
-        for col_idx, col_name in enumerate(data_columns):
-            data_value_map[col_name] = data_values[col_idx] if col_idx < len(data_values) else ""
+        data_value_map: Dict[str, str] = dict(zip(data_columns, data_values))
+        for col_name in data_columns[len(data_values):]:
+            data_value_map[col_name] = ""
         
-        # Store generic column values for flexible data structures
-        for col_idx, val in enumerate(data_values):
-            if col_idx < len(data_columns):
-                data_value_map[data_columns[col_idx]] = val
-            else:
-                # Store extra columns as col1, col2, etc.
-                data_value_map[f"col{col_idx + 1}"] = val
+        # Store extra columns as col1, col2, etc. for flexible data structures
+        for col_idx in range(data_column_count, len(data_values)):
+            data_value_map[f"col{col_idx + 1}"] = data_values[col_idx]
         
         child_rows.append({
             "lineNumber": data_line_idx + 1,
@@ -486,7 +570,9 @@ def build_fk_references(
     txtinout_target_column = metadata.get("txtinout_fk_behavior", {}).get("default_target_column", "name")
     
     # Get file pointer columns to skip (these point to files, not FK references)
-    file_name = file_path.name
+    file_name = file_path.name.lower()
+    source_file = str(file_path)
+    table_name = table["table_name"]
     file_pointer_config = metadata.get("file_pointer_columns", {}).get(file_name, {})
     file_pointer_columns = set()
     if isinstance(file_pointer_config, dict):
@@ -510,6 +596,7 @@ def build_fk_references(
         if column not in column_lower_cache:
             column_lower_cache[column] = column_values_cache[column].str.lower()
         column_lower = column_lower_cache[column]
+        target_table = fk["references"]["table"]
         mask = ~column_lower.isin(null_set)
         filtered = df.loc[mask, ["lineNumber", column]]
 
@@ -520,13 +607,13 @@ def build_fk_references(
         ):
             references.append(
                 {
-                    "sourceFile": str(file_path),
-                    "sourceTable": table["table_name"],
+                    "sourceFile": source_file,
+                    "sourceTable": table_name,
                     "sourceLine": int(line_number),
                     "sourceColumn": column,
                     "fkValue": str(fk_value),
                     "fkValueLower": str(fk_value_lower),
-                    "targetTable": fk["references"]["table"],
+                    "targetTable": target_table,
                     "targetColumn": txtinout_target_column,
                     "resolved": False,
                 }
@@ -547,23 +634,8 @@ def process_management_sch_child_lines(
     """Process child lines for management.sch and extract FK references."""
     references: List[dict] = []
     null_set = {val.lower() for val in fk_null_values}
-    
-    # Operation type to target table mapping
-    op_type_to_table = {
-        'plnt': 'plant_ini',
-        'harv': 'harv_ops',
-        'hvkl': 'plant_ini',
-        'kill': 'plant_ini',
-        'till': 'tillage_til',
-        'irrm': 'irr_ops',
-        'irra': 'irr_ops',
-        'fert': 'fertilizer_frt',
-        'frta': 'fertilizer_frt',
-        'frtc': 'fertilizer_frt',
-        'pest': 'pesticide_pes',
-        'pstc': 'pesticide_pes',
-        'graz': 'graze_ops'
-    }
+    source_file = str(file_path)
+    table_name = table["table_name"]
     
     current_line = start_line
     
@@ -573,11 +645,11 @@ def process_management_sch_child_lines(
             break
         line = lines[current_line].strip()
         if line:
-            dtl_name = line.split()[0] if line.split() else None
+            dtl_name = line.split()[0]
             if dtl_name and dtl_name.lower() not in null_set:
                 references.append({
-                    "sourceFile": str(file_path),
-                    "sourceTable": table["table_name"],
+                    "sourceFile": source_file,
+                    "sourceTable": table_name,
                     "sourceLine": current_line + 1,
                     "sourceColumn": "auto_op_dtl",
                     "fkValue": dtl_name,
@@ -600,15 +672,15 @@ def process_management_sch_child_lines(
                 # op_data1 is typically at index 6 in management schedule operation lines
                 op_data1 = values[MANAGEMENT_SCH_OP_DATA1_INDEX] if len(values) > MANAGEMENT_SCH_OP_DATA1_INDEX else None
                 
-                if op_type and op_data1 and op_type in op_type_to_table and op_data1.lower() not in null_set:
+                if op_type and op_data1 and op_type in MANAGEMENT_SCH_OP_TABLES and op_data1.lower() not in null_set:
                     references.append({
-                        "sourceFile": str(file_path),
-                        "sourceTable": table["table_name"],
+                        "sourceFile": source_file,
+                        "sourceTable": table_name,
                         "sourceLine": current_line + 1,
                         "sourceColumn": f"op_data1({op_type})",
                         "fkValue": op_data1,
                         "fkValueLower": op_data1.lower(),
-                        "targetTable": op_type_to_table[op_type],
+                        "targetTable": MANAGEMENT_SCH_OP_TABLES[op_type],
                         "targetColumn": "name",
                         "resolved": False
                     })
@@ -620,7 +692,8 @@ def process_management_sch_child_lines(
 def process_dtl_file(
     file_path: Path,
     table: dict,
-    fk_null_values: List[str]
+    fk_null_values: List[str],
+    lines: Optional[List[str]] = None
 ) -> Tuple[List[dict], List[dict]]:
     """
     Process decision table files (*.dtl) and extract FK references from fp fields.
@@ -629,19 +702,13 @@ def process_dtl_file(
         (list of row payloads, list of FK references)
     """
     null_set = {val.lower() for val in fk_null_values}
+    source_file = str(file_path)
+    table_name = table["table_name"]
     row_payload: List[dict] = []
     fk_references: List[dict] = []
     
-    # Action type to target table mapping for fp field
-    action_type_to_table = {
-        'harvest': 'harv_ops',
-        'harvest_kill': 'harv_ops',
-        'pest_apply': 'chem_app_ops',
-        'fertilize': 'chem_app_ops'
-    }
-    
-    with file_path.open("r", encoding="utf-8", errors="ignore") as handle:
-        lines = handle.readlines()
+    if lines is None:
+        lines = read_lines(file_path)
     
     if len(lines) < 2:
         return row_payload, fk_references
@@ -666,7 +733,7 @@ def process_dtl_file(
     # Skip the global header line (NAME / DTBL_NAME  CONDS  ALTS  ACTS)
     if current_line < len(lines):
         possible_header_line = lines[current_line].strip().upper()
-        if possible_header_line.startswith('NAME') or possible_header_line.startswith('DTBL_NAME'):
+        if possible_header_line.startswith(('NAME', 'DTBL_NAME')):
             current_line += 1
     
     # Process each decision table
@@ -684,7 +751,7 @@ def process_dtl_file(
             break
 
         header_upper = header_line.upper()
-        if header_upper.startswith('NAME') or header_upper.startswith('DTBL_NAME'):
+        if header_upper.startswith(('NAME', 'DTBL_NAME')):
             current_line += 1
             continue
 
@@ -706,8 +773,8 @@ def process_dtl_file(
 
         # Index the decision table main record
         row_payload.append({
-            "file": str(file_path),
-            "tableName": table["table_name"],
+            "file": source_file,
+            "tableName": table_name,
             "lineNumber": current_line + 1,
             "pkValue": dtbl_name,
             "values": {
@@ -731,7 +798,7 @@ def process_dtl_file(
                 current_line += 1
         
         # Skip conditions section data lines
-        condition_columns = ["cond_var", "obj", "obj_num", "lim_var", "lim_op", "lim_const"]
+        condition_columns = list(DTL_CONDITION_COLUMNS)
         condition_columns.extend([f"alt{idx + 1}" for idx in range(alts)])
         for cond_idx in range(conds):
             while current_line < len(lines) and not lines[current_line].strip():
@@ -760,10 +827,7 @@ def process_dtl_file(
                 current_line += 1
         
         # Process actions section data lines
-        action_columns = [
-            "act_typ", "obj", "obj_num", "act_name", "act_option",
-            "const", "const2", "fp"
-        ]
+        action_columns = list(DTL_ACTION_COLUMNS)
         action_columns.extend([f"out{idx + 1}" for idx in range(alts)])
         for act_idx in range(acts):
             if current_line >= len(lines):
@@ -788,15 +852,15 @@ def process_dtl_file(
                     fp = action_values[DTL_ACTION_FP_INDEX]
                     
                     # Track FK if action type has a mapping and fp is not null
-                    if act_typ in action_type_to_table and fp.lower() not in null_set:
+                    if act_typ in DTL_ACTION_FP_TABLES and fp.lower() not in null_set:
                         fk_references.append({
-                            "sourceFile": str(file_path),
-                            "sourceTable": table["table_name"],
+                            "sourceFile": source_file,
+                            "sourceTable": table_name,
                             "sourceLine": current_line + 1,
                             "sourceColumn": f"fp({act_typ})",
                             "fkValue": fp,
                             "fkValueLower": fp.lower(),
-                            "targetTable": action_type_to_table[act_typ],
+                            "targetTable": DTL_ACTION_FP_TABLES[act_typ],
                             "targetColumn": "name",
                             "resolved": False
                         })
@@ -813,7 +877,7 @@ def extract_soils_details(row: dict, lines: List[str]) -> Tuple[Dict[str, str],
     layer_count = 0
 
     if 0 <= line_idx < len(lines):
-        main_tokens = lines[line_idx].strip().split()
+        main_tokens = lines[line_idx].split()
         if main_tokens:
             name = main_tokens[0]
             try:
@@ -833,22 +897,17 @@ def extract_soils_details(row: dict, lines: List[str]) -> Tuple[Dict[str, str],
             })
 
     if layer_count > 0:
-        layer_columns = [
-            "dp", "bd", "awc", "soil_k", "carbon", "clay", "silt", "sand",
-            "rock", "alb", "usle_k", "ec", "caco3", "ph"
-        ]
+        layer_column_count = len(SOIL_LAYER_COLUMNS)
         for layer_idx in range(layer_count):
             child_line_idx = line_idx + 1 + layer_idx
             if child_line_idx >= len(lines):
                 break
-            child_line = lines[child_line_idx].strip()
-            if not child_line:
+            child_tokens = lines[child_line_idx].split()
+            if not child_tokens:
                 continue
-            child_tokens = child_line.split()
-            child_value_map = {
-                col_name: child_tokens[col_idx] if col_idx < len(child_tokens) else ""
-                for col_idx, col_name in enumerate(layer_columns)
-            }
+            if len(child_tokens) < layer_column_count:
+                child_tokens += [""] * (layer_column_count - len(child_tokens))
+            child_value_map = dict(zip(SOIL_LAYER_COLUMNS, child_tokens))
             child_value_map["layer"] = str(layer_idx + 1)
             child_rows.append({
                 "lineNumber": child_line_idx + 1,
@@ -874,7 +933,7 @@ def extract_plant_details(
 
     line_idx = line_num - 1
     if 0 <= line_idx < len(lines):
-        main_tokens = lines[line_idx].strip().split()
+        main_tokens = lines[line_idx].split()
         if len(main_tokens) >= 3:
             value_updates.update({
                 "name": main_tokens[0],
@@ -882,10 +941,6 @@ def extract_plant_details(
                 "rot_yr_ini": main_tokens[2],
             })
 
-    plant_columns = [
-        "plnt_name", "lc_status", "lai_init", "bm_init",
-        "phu_init", "plnt_pop", "yrs_init", "rsd_init"
-    ]
     for plant_idx in range(child_count):
         child_line_idx = line_idx + 1 + plant_idx
         if child_line_idx >= len(lines):
@@ -896,7 +951,7 @@ def extract_plant_details(
         child_tokens = child_line.split()
         child_value_map = {
             col_name: child_tokens[col_idx] if col_idx < len(child_tokens) else ""
-            for col_idx, col_name in enumerate(plant_columns)
+            for col_idx, col_name in enumerate(PLANT_INI_CHILD_COLUMNS)
         }
         child_rows.append({
             "lineNumber": child_line_idx + 1,
@@ -912,7 +967,7 @@ def get_management_sch_counts(lines: List[str], record: dict) -> Tuple[int, int,
     line_idx = line_num - 1
     main_tokens: List[str] = []
     if 0 <= line_idx < len(lines):
-        main_tokens = lines[line_idx].strip().split()
+        main_tokens = lines[line_idx].split()
 
     if len(main_tokens) >= 3:
         if not record.get("numb_ops"):
@@ -1066,11 +1121,142 @@ def extract_atmo_details(row: dict, lines: List[str]) -> List[dict]:
     return child_rows
 
 
+# Per-file extractors for detail/child lines that follow each main record.
+# Each entry takes (row, lines, child_line_info, record_index) and returns
+# (value_updates, child_rows); the handler is looked up once per file.
+ROW_DETAIL_EXTRACTORS = {
+    # soils.sol: capture layer data lines
+    'soils.sol': lambda row, lines, child_line_info, idx: extract_soils_details(row, lines),
+    # plant.ini: capture plant community member lines
+    'plant.ini': lambda row, lines, child_line_info, idx: extract_plant_details(lines, child_line_info, idx),
+    # management.sch: capture auto/op detail lines
+    'management.sch': lambda row, lines, child_line_info, idx: extract_management_sch_details(lines, row),
+    # weather-wgn.cli: capture monthly data child lines
+    'weather-wgn.cli': lambda row, lines, child_line_info, idx: (
+        {}, extract_weather_wgn_details(lines, child_line_info, idx)
+    ),
+    # atmo.cli: capture station deposition data
+    'atmo.cli': lambda row, lines, child_line_info, idx: ({}, extract_atmo_details(row, lines)),
+}
+
+
+def index_table_file(
+    file_path: Path,
+    table: dict,
+    metadata: dict,
+    fk_null_values: List[str],
+    lines: Optional[List[str]] = None
+) -> Tuple[List[dict], List[dict]]:
+    """
+    Parse one schema-backed file into row payloads and FK references.
+    
+    Returns:
+        (list of row payloads, list of FK references)
+    """
+    if lines is None:
+        lines = read_lines(file_path)
+    # Dispatch on the lowercased name so mixed-case files (LUM.DTL, Plant.ini) parse like their schema entries
+    actual_file_name = file_path.name.lower()
+
+    # Special handling for decision table files (*.dtl)
+    if actual_file_name.endswith('.dtl'):
+        return process_dtl_file(file_path, table, fk_null_values, lines)
+
+    # Parse the file with hierarchical support
+    df, child_line_info, columns, records = parse_lines_to_dataframe(file_path, table, metadata, lines)
+    if df.empty:
+        return [], []
+
+    # Build row payload
+    row_payload = []
+    source_file = str(file_path)
+    table_name = table["table_name"]
+    detail_extractor = ROW_DETAIL_EXTRACTORS.get(actual_file_name)
+    for idx, row in enumerate(records):
+        values = {col: str(row.get(col, "")) for col in columns}
+        row_dict = {
+            "file": source_file,
+            "tableName": table_name,
+            "lineNumber": int(row["lineNumber"]),
+            "pkValue": str(row["pkValue"]),
+            "pkValueLower": str(row.get("pkValueLower", "")).lower() if row.get("pkValueLower") else str(row["pkValue"]).lower(),
+            "values": values,
+        }
+
+        if detail_extractor is not None:
+            value_updates, child_rows = detail_extractor(row, lines, child_line_info, idx)
+            if value_updates:
+                row_dict["values"].update(value_updates)
+            if child_rows:
+                row_dict["childRows"] = child_rows
+
+        row_payload.append(row_dict)
+
+    # Build FK references for main records
+    fk_references = build_fk_references(df, table, file_path, fk_null_values, metadata)
+
+    # Special handling for management.sch child lines
+    if actual_file_name == 'management.sch' and lines:
+        for main_record in records:
+            line_num = int(main_record.get("lineNumber", 0))
+            if line_num <= 0:
+                continue
+            numb_auto, numb_ops, _ = get_management_sch_counts(lines, main_record)
+            if numb_auto <= 0 and numb_ops <= 0:
+                continue
+            child_refs = process_management_sch_child_lines(
+                file_path, table, lines, line_num, numb_auto, numb_ops, fk_null_values
+            )
+            fk_references.extend(child_refs)
+
+    return row_payload, fk_references
+
+
+_WORKER_CONTEXT: Dict[str, object] = {}
+
+
+def _init_index_worker(metadata: dict, fk_null_values: List[str]) -> None:
+    # os.nice is POSIX-only; on Windows workers keep the default priority
+    if hasattr(os, "nice"):
+        try:
+            os.nice(WORKER_NICE_INCREMENT)
+        except OSError:
+            pass
+    _WORKER_CONTEXT["metadata"] = metadata
+    _WORKER_CONTEXT["fk_null_values"] = fk_null_values
+
+
+def _index_table_file_in_worker(file_path: Path, table: dict) -> Tuple[List[dict], List[dict]]:
+    return index_table_file(file_path, table, _WORKER_CONTEXT["metadata"], _WORKER_CONTEXT["fk_null_values"])
+
+
+def index_files_with_read_ahead(
+    executor: ThreadPoolExecutor,
+    resolved_files: List[Tuple[dict, Path]],
+    metadata: dict,
+    fk_null_values: List[str]
+) -> Iterator[Tuple[List[dict], List[dict]]]:
+    """Index files in order on this thread while the next few are read on the pool.
+
+    At most FILE_READ_WORKERS reads are outstanding, so only that many files' lines are
+    held in memory ahead of the parser.
+    """
+    pending_reads: deque = deque()
+    next_read = 0
+    for table, file_path in resolved_files:
+        while next_read < len(resolved_files) and len(pending_reads) < FILE_READ_WORKERS:
+            pending_reads.append(executor.submit(read_lines, resolved_files[next_read][1]))
+            next_read += 1
+        lines = pending_reads.popleft().result()
+        yield index_table_file(file_path, table, metadata, fk_null_values, lines)
+
+
 def build_index(
     dataset_path: Path,
     schema_path: Path,
     metadata_path: Path,
-    include_output_tables: bool = False
+    include_output_tables: bool = False,
+    workers: int = 1
 ) -> dict:
     schema = load_json(schema_path)
     metadata = load_json(metadata_path) if metadata_path.exists() else {}
@@ -1085,16 +1271,19 @@ def build_index(
     table_name_to_file = metadata.get("table_name_to_file_name", {}) if isinstance(metadata, dict) else {}
     file_cio_files = load_file_cio_filenames(dataset_path)
 
+    dataset_file_names = list_dataset_files(dataset_path)
+    dataset_files = build_dataset_file_lookup(dataset_file_names)
+    files_by_suffix = group_dataset_files_by_suffix(dataset_file_names)
+
+    resolved_files: List[Tuple[dict, Path]] = []
     for file_name, table in schema.get("tables", {}).items():
-        file_path = dataset_path / file_name
-        if not file_path.exists():
+        actual_name = find_dataset_file(dataset_files, file_name)
+        if actual_name is None:
             mapped_name = table_name_to_file.get(table.get("table_name"))
             if mapped_name:
-                mapped_path = dataset_path / mapped_name
-                if mapped_path.exists():
-                    file_path = mapped_path
+                actual_name = find_dataset_file(dataset_files, mapped_name)
 
-        if not file_path.exists():
+        if actual_name is None:
             alternate_names = set()
             if "-" in file_name:
                 alternate_names.add(file_name.replace("-", "_"))
@@ -1102,16 +1291,17 @@ def build_index(
                 alternate_names.add(file_name.replace("_", "-"))
             alternate_names.add(file_name.replace("-", "_").replace("_", "-"))
             for alternate_name in alternate_names:
-                candidate_path = dataset_path / alternate_name
-                if candidate_path.exists():
-                    file_path = candidate_path
+                actual_name = find_dataset_file(dataset_files, alternate_name)
+                if actual_name is not None:
                     break
-            if not file_path.exists():
-                file_cio_override = find_file_cio_override(dataset_path, file_name, file_cio_files)
-                if file_cio_override is not None:
-                    file_path = file_cio_override
-                else:
-                    continue
+
+        if actual_name is not None:
+            file_path = dataset_path / actual_name
+        else:
+            file_cio_override = find_file_cio_override(dataset_path, file_name, file_cio_files, dataset_files)
+            if file_cio_override is None:
+                continue
+            file_path = file_cio_override
 
         actual_file_name = file_path.name
         processed_files.add(actual_file_name.lower())
@@ -1121,102 +1311,49 @@ def build_index(
         # separately in the TypeScript parseFileCio() method
         if actual_file_name.lower() == 'file.cio':
             continue
-        
-        # Special handling for decision table files (*.dtl)
-        if actual_file_name.endswith('.dtl'):
-            row_payload, dtl_fk_refs = process_dtl_file(file_path, table, fk_null_values)
+        resolved_files.append((table, file_path))
+
+    def merge_results(results) -> None:
+        for (table, _), (row_payload, file_fk_refs) in zip(resolved_files, results):
             if row_payload:
                 tables_payload[table["table_name"]] = row_payload
-                fk_references.extend(dtl_fk_refs)
-            continue
-
-        with file_path.open("r", encoding="utf-8", errors="ignore") as handle:
-            lines = handle.readlines()
-
-        # Parse the file with hierarchical support
-        df, child_line_info, columns, records = parse_lines_to_dataframe(file_path, table, metadata, lines)
-        if df.empty:
-            continue
-
-        # Build row payload
-        row_payload = []
-        for idx, row in enumerate(records):
-            values = {col: str(row.get(col, "")) for col in columns}
-            row_dict = {
-                "file": str(file_path),
-                "tableName": table["table_name"],
-                "lineNumber": int(row["lineNumber"]),
-                "pkValue": str(row["pkValue"]),
-                "pkValueLower": str(row.get("pkValueLower", "")).lower() if row.get("pkValueLower") else str(row["pkValue"]).lower(),
-                "values": values,
-            }
-
-            # Special handling for soils.sol: capture layer data lines
-            if actual_file_name == 'soils.sol' and lines:
-                value_updates, child_rows = extract_soils_details(row, lines)
-                if value_updates:
-                    row_dict["values"].update(value_updates)
-                if child_rows:
-                    row_dict["childRows"] = child_rows
-
-            # Special handling for plant.ini: capture plant community member lines
-            if actual_file_name == 'plant.ini' and lines:
-                value_updates, child_rows = extract_plant_details(lines, child_line_info, idx)
-                if value_updates:
-                    row_dict["values"].update(value_updates)
-                if child_rows:
-                    row_dict["childRows"] = child_rows
-
-            # Special handling for management.sch: capture auto/op detail lines
-            if actual_file_name == 'management.sch' and lines:
-                value_updates, child_rows = extract_management_sch_details(lines, row)
-                if value_updates:
-                    row_dict["values"].update(value_updates)
-                if child_rows:
-                    row_dict["childRows"] = child_rows
-            
-            # Special handling for weather-wgn.cli: capture monthly data child lines
-            if actual_file_name == 'weather-wgn.cli':
-                child_rows = extract_weather_wgn_details(lines, child_line_info, idx)
-                if child_rows:
-                    row_dict["childRows"] = child_rows
-            
-            # Special handling for atmo.cli: capture station deposition data
-            if actual_file_name == 'atmo.cli':
-                child_rows = extract_atmo_details(row, lines)
-                if child_rows:
-                    row_dict["childRows"] = child_rows
-
-            row_payload.append(row_dict)
-
-        tables_payload[table["table_name"]] = row_payload
-        
-        # Build FK references for main records
-        fk_references.extend(build_fk_references(df, table, file_path, fk_null_values, metadata))
-        
-        # Special handling for management.sch child lines
-        if actual_file_name == 'management.sch' and lines:
-            for main_record in records:
-                line_num = int(main_record.get("lineNumber", 0))
-                if line_num <= 0:
-                    continue
-                numb_auto, numb_ops, _ = get_management_sch_counts(lines, main_record)
-                if numb_auto <= 0 and numb_ops <= 0:
-                    continue
-                child_refs = process_management_sch_child_lines(
-                    file_path, table, lines, line_num, numb_auto, numb_ops, fk_null_values
-                )
-                fk_references.extend(child_refs)
+                fk_references.extend(file_fk_refs)
+
+    if workers > 1:
+        # Imported here: the process pool pulls in multiprocessing (~20 ms), which the
+        # default serial path never needs.
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Parse files in worker processes; results are merged here in schema order.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_index_worker,
+            initargs=(metadata, fk_null_values),
+        ) as executor:
+            merge_results(executor.map(
+                _index_table_file_in_worker,
+                [file_path for _, file_path in resolved_files],
+                [table for table, _ in resolved_files],
+            ))
+    else:
+        with ThreadPoolExecutor(max_workers=FILE_READ_WORKERS) as executor:
+            merge_results(index_files_with_read_ahead(executor, resolved_files, metadata, fk_null_values))
 
     if include_output_tables:
         for extension, schema_file in WEATHER_DATA_SCHEMA_FILES.items():
+            # Extensions with no files in the listing are skipped without touching the disk
+            weather_file_names = files_by_suffix.get(extension)
+            if not weather_file_names:
+                continue
             table = schema.get("tables", {}).get(schema_file)
             if not table:
                 continue
-            for file_path in dataset_path.glob(f"*{extension}"):
-                if file_path.name.lower() in processed_files:
+            weather_columns = get_weather_schema_columns(table)
+            for weather_file_name in weather_file_names:
+                if weather_file_name.lower() in processed_files:
                     continue
-                row_payload, file_map = build_weather_data_rows(file_path, table)
+                file_path = dataset_path / weather_file_name
+                row_payload, file_map = build_weather_data_rows(file_path, table, weather_columns)
                 if not row_payload:
                     continue
                 table_name = table["table_name"]
@@ -1225,9 +1362,10 @@ def build_index(
                 processed_files.add(file_path.name.lower())
 
     # Process additional decision table files not covered by the schema
-    for dtl_path in dataset_path.glob("*.dtl"):
-        if dtl_path.name.lower() in processed_files:
+    for dtl_file_name in files_by_suffix.get(".dtl", []):
+        if dtl_file_name.lower() in processed_files:
             continue
+        dtl_path = dataset_path / dtl_file_name
         derived_table_name = dtl_path.name.replace(".", "_").replace("-", "_").lower()
         dtl_table = {"table_name": derived_table_name, "file_name": dtl_path.name}
         row_payload, dtl_fk_refs = process_dtl_file(dtl_path, dtl_table, fk_null_values)
@@ -1257,19 +1395,30 @@ def main() -> None:
         action="store_true",
         help="Include generated tables for output/weather data files (disabled by default)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to parse files (default: 1, parse in this process)",
+    )
 
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     payload = build_index(
         args.dataset,
         args.schema,
         args.metadata,
         include_output_tables=args.include_output_tables,
+        workers=args.workers,
     )
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
+        # The extension only parses this file, so write it compactly: one-shot dumps without
+        # indent runs in the C encoder and lands in a single write instead of many small ones.
         with args.output.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+            handle.write(json.dumps(payload, separators=(",", ":")))
     else:
         print(json.dumps(payload, indent=2))
 
@@ -8,6 +8,7 @@ properly integrated and can detect FK relationships and file pointers.
 
 import json
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -171,6 +172,70 @@ def test_special_structure_detection():
         return True  # Not a failure, just a warning
 
 
+def test_mixed_case_file_names():
+    """Test that files whose on-disk spelling differs in case parse like their schema entries."""
+    try:
+        sys.path.insert(0, str(Path(__file__).parent))
+        from pandas_indexer import build_index
+    except ImportError as e:
+        print(f"WARN: pandas indexer unavailable ({e}); skipping")
+        return True
+
+    schema_dir = Path(__file__).parent.parent / 'resources' / 'schema'
+    files = {
+        'Soils.sol': (
+            "soils.sol: test\n"
+            "name  nly  hyd_grp  dp_tot  anion_excl  perc_crk  texture  dp  bd  awc  soil_k  carbon  clay  silt  sand  rock  alb  usle_k  ec  caco3  ph\n"
+            "soil1  2  B  1000.0  0.5  0.5  loam\n"
+            "  300.0  1.4  0.2  10.0  1.0  20.0  40.0  40.0  0.0  0.1  0.3  0.0  0.0  6.5\n"
+            "  1000.0  1.5  0.18  5.0  0.5  25.0  35.0  40.0  0.0  0.1  0.3  0.0  0.0  6.8\n"
+        ),
+        'Plant.ini': (
+            "plant.ini: test\n"
+            "pcom_name  plt_cnt  rot_yr_ini  plt_name  lc_status  lai_init  bm_init  phu_init  plnt_pop  yrs_init  rsd_init\n"
+            "soilplant1  2  1\n"
+            "  corn  y  0.0  0.0  0.0  0.0  0.0  1000.0\n"
+            "  soyb  n  0.0  0.0  0.0  0.0  0.0  1000.0\n"
+        ),
+        'LUM.DTL': (
+            "lum.dtl: test\n1\n\n"
+            "name  conds  alts  acts\n"
+            "pl_hv_corn  1  1  1\n"
+            "cond_var  obj  obj_num  lim_var  lim_op  lim_const  alt1\n"
+            "jday  hru  0  null  -  120  >\n"
+            "act_typ  obj  obj_num  name  option  const  const2  fp  outcome\n"
+            "harvest  hru  0  hvcorn  corn  0  0  grain  y\n"
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as dataset_dir:
+        dataset_path = Path(dataset_dir)
+        for file_name, content in files.items():
+            (dataset_path / file_name).write_text(content, encoding='utf-8')
+        payload = build_index(
+            dataset_path,
+            schema_dir / 'swatplus-editor-schema.json',
+            schema_dir / 'txtinout-metadata.json',
+        )
+
+    tables = payload['tables']
+    soils = tables.get('soils_sol', [])
+    plants = tables.get('plant_ini', [])
+    dtl = tables.get('lum_dtl', [])
+    if len(soils) != 1 or len(soils[0].get('childRows') or []) != 2:
+        print(f"FAIL: Soils.sol parsed into {len(soils)} soil record(s), expected 1 with 2 layers")
+        return False
+    if len(plants) != 1:
+        print(f"FAIL: Plant.ini parsed into {len(plants)} record(s), expected 1")
+        return False
+    if len(dtl) != 1 or not dtl[0].get('childRows'):
+        print(f"FAIL: LUM.DTL was not parsed as a decision table")
+        return False
+
+    print("PASS: Mixed-case Soils.sol, Plant.ini and LUM.DTL parse like their schema entries")
+    return True
+
+
 def main():
     """Run all tests."""
     print("Running enhanced schema tests...\n")
@@ -182,6 +247,7 @@ def main():
         ("File pointer columns populated", test_file_pointers_populated),
         ("File metadata populated", test_file_metadata_populated),
         ("Special structure detection", test_special_structure_detection),
+        ("Mixed-case file names", test_mixed_case_file_names),
     ]
     
     results = []